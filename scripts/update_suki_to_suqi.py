@@ -4,40 +4,75 @@ Update all instances of 'suki' to 'Suqi' in the codebase
 Handles different case variations and file types
 """
 
+import mmap
 import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Define the root directory
 ROOT_DIR = Path(__file__).parent.parent
 
 # File extensions to process
-EXTENSIONS = ['.ts', '.tsx', '.js', '.jsx', '.sql', '.md', '.json', '.yaml', '.yml']
+EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.sql', '.md', '.json', '.yaml', '.yml')
 
 # Directories to skip
 SKIP_DIRS = {'node_modules', '.next', 'dist', '.git', '__pycache__', '.venv'}
 
-# Counter for changes
+# Case variations to rewrite; other mixed-case spellings are left alone
+REPLACEMENTS = {'SUKI': 'SUQI', 'Suki': 'Suqi', 'suki': 'suqi'}
+SUKI_PATTERN = re.compile(r'suki', re.IGNORECASE)
+SUKI_BYTES = tuple(variation.encode('utf-8') for variation in REPLACEMENTS)
+
+# Files at least this large are pre-scanned as bytes before decoding
+MMAP_THRESHOLD = 1024 * 1024
+
+def _replace_match(match):
+    """Map a single matched variation to its Suqi spelling"""
+    text = match.group(0)
+    return REPLACEMENTS.get(text, text)
+
+def contains_suki(text):
+    """Cheap substring check for any variation that would be rewritten"""
+    return any(variation in text for variation in REPLACEMENTS)
+
+def file_may_contain_suki(file_path):
+    """Scan large files as raw bytes so no-match files are never decoded"""
+    size = file_path.stat().st_size
+    if size == 0:
+        return False
+    if size < MMAP_THRESHOLD:
+        return True
+    
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return any(mm.find(variation) != -1 for variation in SUKI_BYTES)
+
+def replace_suki(text):
+    """Rewrite all variations in one pass, returning (updated, match_count)"""
+    return SUKI_PATTERN.subn(_replace_match, text)
+
+# Worker threads for file processing (I/O bound, so more than CPU count)
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Counter for changes, shared across worker threads
 changes_made = 0
 files_updated = 0
+counter_lock = threading.Lock()
 
 def update_content(content):
     """Update all variations of suki to Suqi"""
     global changes_made
     
-    # Count original occurrences
-    original_count = len(re.findall(r'suki|Suki|SUKI', content, re.IGNORECASE))
-    
-    # Replace all variations
-    updated = content
-    updated = re.sub(r'SUKI', 'SUQI', updated)
-    updated = re.sub(r'Suki', 'Suqi', updated)
-    updated = re.sub(r'suki', 'suqi', updated)
+    # Replace all variations and count original occurrences
+    updated, original_count = replace_suki(content)
     
     # Count changes
     if updated != content:
-        changes_made += original_count
+        with counter_lock:
+            changes_made += original_count
         return updated
     
     return None
@@ -47,10 +82,17 @@ def process_file(file_path):
     global files_updated
     
     try:
+        if not file_may_contain_suki(file_path):
+            return False
+        
         # Read file
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
+        # Skip regex work for the common no-match case
+        if not contains_suki(content):
+            return False
+        
         # Update content
         updated_content = update_content(content)
         
@@ -59,7 +101,8 @@ def process_file(file_path):
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(updated_content)
             
-            files_updated += 1
+            with counter_lock:
+                files_updated += 1
             print(f"✓ Updated: {file_path.relative_to(ROOT_DIR)}")
             return True
             
@@ -68,44 +111,47 @@ def process_file(file_path):
     
     return False
 
-def rename_file_if_needed(file_path):
-    """Rename file if it contains 'suki' in the name"""
-    file_name = file_path.name
+def handle_file(file_path):
+    """Rewrite file content, then rename the file if its name contains suki"""
+    process_file(file_path)
     
-    if 'suki' in file_name.lower():
-        new_name = file_name
-        new_name = re.sub(r'SUKI', 'SUQI', new_name)
-        new_name = re.sub(r'Suki', 'Suqi', new_name)
-        new_name = re.sub(r'suki', 'suqi', new_name)
-        
-        if new_name != file_name:
-            new_path = file_path.parent / new_name
-            file_path.rename(new_path)
-            print(f"📁 Renamed: {file_path.name} → {new_name}")
-            return new_path
+    file_name = file_path.name
+    if not contains_suki(file_name):
+        return file_path
     
-    return file_path
+    new_name, _ = replace_suki(file_name)
+    new_path = file_path.with_name(new_name)
+    os.rename(file_path, new_path)
+    print(f"📁 Renamed: {file_name} → {new_name}")
+    return new_path
+
+def walk_files(directory):
+    """Recursively yield file entries, pruning skipped directories"""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        yield from walk_files(entry.path)
+                elif not entry.is_dir():
+                    yield entry
+    except OSError:
+        # Match os.walk, which silently skips unreadable directories
+        return
 
 def main():
     print("🔄 Updating all 'suki' references to 'Suqi'...\n")
     
-    # Walk through all files
-    for root, dirs, files in os.walk(ROOT_DIR):
-        # Skip directories
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        root_path = Path(root)
-        
-        for file in files:
-            file_path = root_path / file
-            
-            # Check if file should be processed
-            if file_path.suffix in EXTENSIONS:
-                # Process file content
-                process_file(file_path)
-                
-                # Rename file if needed
-                rename_file_if_needed(file_path)
+    # Collect candidate files, only building a Path for matching names
+    candidate_paths = [
+        Path(entry.path)
+        for entry in walk_files(ROOT_DIR)
+        if entry.name.endswith(EXTENSIONS)
+    ]
+    
+    # Process files in parallel; each file is independent
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        list(executor.map(handle_file, candidate_paths))
     
     # Special handling for the migration file
     migration_file = ROOT_DIR / "supabase/migrations/20250629110000_suki_analytics_enhancements.sql"